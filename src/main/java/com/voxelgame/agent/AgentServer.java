@@ -7,6 +7,7 @@ import com.voxelgame.world.WorldAccess;
 import org.java_websocket.WebSocket;
 import org.java_websocket.handshake.ClientHandshake;
 import org.java_websocket.server.WebSocketServer;
+import org.joml.Vector3f;
 
 import java.net.InetSocketAddress;
 import java.util.Collections;
@@ -34,6 +35,12 @@ public class AgentServer extends WebSocketServer {
     /** Throttle: minimum ms between state broadcasts. ~20 Hz = 50ms. */
     private static final long MIN_BROADCAST_INTERVAL_MS = 50;
 
+    /**
+     * Initial capacity of the reused state buffer. A full state message is
+     * ~20 KB, dominated by the 64×36 simscreen at ~8 chars per cell.
+     */
+    private static final int STATE_BUFFER_CAPACITY = 32 * 1024;
+
     private final ActionQueue actionQueue;
     private final Set<WebSocket> agents = Collections.newSetFromMap(new ConcurrentHashMap<>());
     private final AtomicLong tickCounter = new AtomicLong(0);
@@ -42,11 +49,17 @@ public class AgentServer extends WebSocketServer {
     // SimScreen generator (created once, reused)
     private final SimScreen simScreen = new SimScreen();
 
+    // State message buffer (game loop thread only, cleared and reused each tick)
+    private final StringBuilder stateBuffer = new StringBuilder(STATE_BUFFER_CAPACITY);
+
     public AgentServer(int port, ActionQueue actionQueue) {
         super(new InetSocketAddress(port));
         this.actionQueue = actionQueue;
         setReuseAddr(true);
         setDaemon(true);
+        // State ticks and action frames are small and latency-sensitive;
+        // don't let Nagle hold them back waiting for more data.
+        setTcpNoDelay(true);
     }
 
     public AgentServer(ActionQueue actionQueue) {
@@ -116,12 +129,11 @@ public class AgentServer extends WebSocketServer {
 
         long tick = tickCounter.incrementAndGet();
         Camera camera = player.getCamera();
+        Vector3f pos = camera.getPosition();
 
         // Build state message
         StringBuilder sb = Messages.buildStateStart(
-            tick,
-            camera.getPosition().x, camera.getPosition().y, camera.getPosition().z,
-            camera.getYaw(), camera.getPitch()
+            stateBuffer, tick, pos.x, pos.y, pos.z, camera.getYaw(), camera.getPitch()
         );
 
         // Crosshair raycast
@@ -153,13 +165,13 @@ public class AgentServer extends WebSocketServer {
 
         String stateJson = Messages.finishState(sb);
 
-        // Broadcast to all connected agents
-        for (WebSocket agent : agents) {
-            try {
-                agent.send(stateJson);
-            } catch (Exception e) {
-                LOG.fine("[AgentServer] Failed to send state to " + connId(agent));
-            }
+        // Broadcast to all connected agents. broadcast() UTF-8 encodes the payload
+        // once for all agents; each connection still frames its own copy.
+        // Closed connections are skipped.
+        try {
+            broadcast(stateJson, agents);
+        } catch (Exception e) {
+            LOG.fine("[AgentServer] Failed to broadcast state: " + e.getMessage());
         }
     }
 
@@ -168,8 +180,9 @@ public class AgentServer extends WebSocketServer {
      */
     private void appendCrosshairRaycast(StringBuilder sb, Player player, WorldAccess world) {
         Camera camera = player.getCamera();
+        Vector3f pos = camera.getPosition();
         var hit = com.voxelgame.world.Raycast.cast(
-            world, camera.getPosition(), camera.getFront(), 8.0f
+            world, pos, camera.getFront(), 8.0f
         );
 
         if (hit != null) {
@@ -177,11 +190,10 @@ public class AgentServer extends WebSocketServer {
             var block = com.voxelgame.world.Blocks.get(blockId);
 
             Messages.CellClass cls = SimScreen.classifyBlock(blockId, block);
-            float dist = (float) Math.sqrt(
-                Math.pow(hit.x() + 0.5 - camera.getPosition().x, 2) +
-                Math.pow(hit.y() + 0.5 - camera.getPosition().y, 2) +
-                Math.pow(hit.z() + 0.5 - camera.getPosition().z, 2)
-            );
+            double dx = hit.x() + 0.5 - pos.x;
+            double dy = hit.y() + 0.5 - pos.y;
+            double dz = hit.z() + 0.5 - pos.z;
+            float dist = (float) Math.sqrt(dx * dx + dy * dy + dz * dz);
 
             Messages.appendRaycast(sb, "block", cls, block.name(),
                 Messages.depthBucket(dist),
@@ -1,5 +1,8 @@
 package com.voxelgame.agent;
 
+import java.math.BigDecimal;
+import java.math.RoundingMode;
+
 /**
  * Message schemas for the agent protocol.
  * <p>
@@ -43,12 +46,19 @@ public final class Messages {
     /** Format float, strip trailing zeros. */
     static String jsonNum(float v) {
         if (v == (int) v) return String.valueOf((int) v);
-        return String.format("%.3f", v).replaceAll("0+$", "").replaceAll("\\.$", "");
+        return jsonNum((double) v);
     }
 
+    /**
+     * Format double to at most 3 decimals, strip trailing zeros.
+     * Called several times per state tick, so this avoids String.format
+     * (which is also locale-dependent) and regex replaceAll.
+     */
     static String jsonNum(double v) {
         if (v == (long) v) return String.valueOf((long) v);
-        return String.format("%.3f", v).replaceAll("0+$", "").replaceAll("\\.$", "");
+        if (!Double.isFinite(v)) return "null";
+        return BigDecimal.valueOf(v).setScale(3, RoundingMode.HALF_UP)
+            .stripTrailingZeros().toPlainString();
     }
 
     // ---- SimScreen cell classification ----
@@ -123,10 +133,16 @@ public final class Messages {
     // ---- State message (per-tick) ----
 
     /**
-     * Build state message header (everything except simscreen, which is appended separately).
+     * Build state message header (everything except simscreen, which is appended separately)
+     * into a caller-owned buffer, clearing it first. Lets the per-tick broadcaster
+     * reuse one pre-sized buffer instead of allocating and regrowing a new one every tick.
+     * <p>
+     * The message always starts with <code>{"type":"state",</code> so clients can
+     * dispatch on that byte prefix without decoding the whole payload.
      */
-    public static StringBuilder buildStateStart(long tick, float x, float y, float z, float yaw, float pitch) {
-        StringBuilder sb = new StringBuilder(4096);
+    public static StringBuilder buildStateStart(StringBuilder sb, long tick, float x, float y, float z,
+                                                float yaw, float pitch) {
+        sb.setLength(0);
         sb.append("{\"type\":\"state\",\"tick\":").append(tick);
         sb.append(",\"pose\":{\"x\":").append(jsonNum(x));
         sb.append(",\"y\":").append(jsonNum(y));
@@ -6,6 +6,7 @@ import javax.imageio.ImageIO;
 import java.awt.image.BufferedImage;
 import java.io.InputStream;
 import java.nio.ByteBuffer;
+import java.nio.ByteOrder;
 
 import static org.lwjgl.opengl.GL33.*;
 
@@ -68,28 +69,20 @@ public class TextureAtlas {
                     ATLAS_WIDTH + "x" + ATLAS_HEIGHT + ")");
             }
 
-            // Convert BufferedImage to ByteBuffer (RGBA format)
-            ByteBuffer pixels = MemoryUtil.memAlloc(ATLAS_WIDTH * ATLAS_HEIGHT * 4);
-            
-            for (int y = 0; y < ATLAS_HEIGHT; y++) {
-                for (int x = 0; x < ATLAS_WIDTH; x++) {
-                    int rgba = img.getRGB(x, y);
-                    
-                    // Extract RGBA components (BufferedImage uses ARGB format)
-                    int r = (rgba >> 16) & 0xFF;
-                    int g = (rgba >> 8) & 0xFF;
-                    int b = rgba & 0xFF;
-                    int a = (rgba >> 24) & 0xFF;
-                    
-                    // Write to ByteBuffer in RGBA order
-                    pixels.put((byte) r);
-                    pixels.put((byte) g);
-                    pixels.put((byte) b);
-                    pixels.put((byte) a);
-                }
+            // Read the whole atlas in one call instead of one getRGB per pixel
+            int[] argb = img.getRGB(0, 0, ATLAS_WIDTH, ATLAS_HEIGHT, null, 0, ATLAS_WIDTH);
+
+            // BufferedImage uses ARGB; rotating left by 8 bits gives RGBA
+            for (int i = 0; i < argb.length; i++) {
+                argb[i] = Integer.rotateLeft(argb[i], 8);
             }
-            
-            pixels.flip();
+
+            // Copy into a ByteBuffer (RGBA format) in one bulk put. Big-endian so
+            // each RGBA-packed int lands as R, G, B, A bytes in memory. The int
+            // view has its own position, so the byte buffer stays at [0, capacity).
+            ByteBuffer pixels = MemoryUtil.memAlloc(ATLAS_WIDTH * ATLAS_HEIGHT * 4)
+                .order(ByteOrder.BIG_ENDIAN);
+            pixels.asIntBuffer().put(argb);
             return pixels;
             
         } catch (Exception e) {